@@ -4,33 +4,80 @@ import sys
 import re
 import textwrap
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# patterns used on every call, compiled once
+_HYPHEN_RE  = re.compile(r'[-¬]\n')
+_NOT_RE     = re.compile(r'¬\s*')
+# headers are written by the extractors with ASCII digits only
+_HDR_RE     = re.compile(r'^(--- Page \d+ --+)(\r?\n)?', re.MULTILINE | re.ASCII)
+_PARA_SPLIT = re.compile(r'\n\s*\n')
+_NUM_RE     = re.compile(r'(\d+)', re.ASCII)
+
+def natural_key(path):
+    """
+    Sort key for chunk files that orders the digit runs in the file
+    name numerically, so part2.txt sorts before part10.txt. Files with
+    the same name fall back to their full path.
+    """
+    # the capturing split puts the ASCII digit runs at the odd positions
+    parts = [int(t) if i % 2 else t for i, t in enumerate(_NUM_RE.split(path.name))]
+    return parts, str(path)
+
+def longest_overlap(tail, head):
+    """
+    Return the length of the longest prefix of `head` that is also a
+    suffix of `tail`.
+
+    Candidate starts in `tail` are located with bytes.find on the first
+    byte of `head` and verified with bytes.startswith against a
+    memoryview of `head`, so all scanning and comparing runs in C
+    rather than in a Python-level loop. The first verified candidate
+    is the longest overlap.
+    """
+    if not head or not tail:
+        return 0
+
+    first = head[:1]
+    view = memoryview(head)
+    # an overlap can never be longer than head
+    pos = tail.find(first, max(0, len(tail) - len(head)))
+    while pos != -1:
+        if tail.startswith(view[:len(tail) - pos], pos):
+            return len(tail) - pos
+        pos = tail.find(first, pos + 1)
+    return 0
+
 def merge_with_overlap(paths, max_check=500):
     """
-    Read each file in sorted order, detect and strip overlapping
+    Read each file in natural sort order, detect and strip overlapping
     text between the end of the accumulated text and the start of
     the new chunk.
+
+    Files are read concurrently and merged as raw bytes; the result
+    is decoded from UTF-8 once at the end.
     """
-    merged = ""
-    for p in sorted(paths):
-        text = p.read_text(encoding='utf-8', errors='ignore')
-        if not merged:
-            merged = text
-            continue
+    paths = sorted(paths, key=natural_key)
+    if not paths:
+        return ""
 
-        tail = merged[-max_check:]
-        head = text[:max_check]
+    # reads are I/O-bound and release the GIL, so prefetch them all
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as ex:
+        chunks = list(ex.map(lambda p: p.read_bytes(), paths))
 
-        # find longest overlap
-        for i in range(len(head), 0, -1):
-            if tail.endswith(head[:i]):
-                text = text[i:]
-                break
+    parts = []
+    # last max_check bytes of everything merged so far
+    tail = b""
+    for chunk in chunks:
+        # strip the longest overlap; a memoryview slice shares the chunk's
+        # bytes instead of copying them again before the final join
+        text = memoryview(chunk)[longest_overlap(tail, chunk[:max_check]):]
 
-        merged += text
+        parts.append(text)
+        tail = (tail + text[-max_check:])[-max_check:]
 
-    return merged
+    return b"".join(parts).decode('utf-8', errors='ignore')
 
 def trim_hyphens(text):
     """
@@ -38,9 +85,9 @@ def trim_hyphens(text):
     2) Remove any leftover “¬” plus following spaces.
     """
     # join broken words
-    text = re.sub(r'[-¬]\n', '', text)
+    text = _HYPHEN_RE.sub('', text)
     # strip stray PDF continuation marks
-    return re.sub(r'¬\s*', '', text)
+    return _NOT_RE.sub('', text)
 
 def add_header_spacing(text: str) -> str:
     """
@@ -51,25 +98,38 @@ def add_header_spacing(text: str) -> str:
     # newline, and replace it with the header and a double newline.
     # This correctly separates headers from text on the same line and
     # ensures a proper paragraph break for reflow.
-    return re.sub(
-        r'^(--- Page \d+ --+)(\r?\n)?',
-        r'\1\n\n',
-        text,
-        flags=re.MULTILINE
-    )
+    return _HDR_RE.sub(r'\1\n\n', text)
+
 
+def iter_paragraphs(text, width=9999):
+    """
+    Yield each reflowed paragraph of `text` in turn, so callers can
+    write them out without building the joined document.
+    """
+    for p in _PARA_SPLIT.split(text.strip()):
+        single = ' '.join(p.split())
+        # a paragraph that already fits needs no wrapping
+        if len(single) <= width:
+            yield single
+        else:
+            yield textwrap.fill(single, width=width)
 
 def reflow_paragraphs(text, width=9999):
     """
     Split on blank lines, collapse each paragraph's internal
     whitespace to single spaces, then join lines to the given width.
     """
-    paras = re.split(r'\n\s*\n', text.strip())
-    out = []
-    for p in paras:
-        single = ' '.join(p.split())
-        out.append(textwrap.fill(single, width=width))
-    return "\n\n".join(out)
+    return "\n\n".join(iter_paragraphs(text, width=width))
+
+def write_paragraphs(paras, out):
+    """
+    Write paragraphs to the binary stream `out` as UTF-8, separated
+    by blank lines.
+    """
+    for i, para in enumerate(paras):
+        if i:
+            out.write(b"\n\n")
+        out.write(para.encode('utf-8'))
 
 def main():
     parser = argparse.ArgumentParser(
@@ -81,7 +141,7 @@ def main():
     )
     parser.add_argument(
         '--max-check', type=int, default=500,
-        help="Max chars to check for overlap (default: 500)"
+        help="Max bytes to check for overlap (default: 500)"
     )
     parser.add_argument(
         '--width', type=int, default=9999,
@@ -97,13 +157,14 @@ def main():
     merged  = merge_with_overlap(paths, max_check=args.max_check)
     trimmed = trim_hyphens(merged)
     spaced  = add_header_spacing(trimmed)
-    final   = reflow_paragraphs(spaced, width=args.width)
+    paras   = iter_paragraphs(spaced, width=args.width)
 
     if args.output:
-        args.output.write_text(final, encoding='utf-8')
+        with args.output.open('wb') as out:
+            write_paragraphs(paras, out)
     else:
         # write UTF-8 bytes directly to avoid Windows CP1252 errors
-        sys.stdout.buffer.write(final.encode('utf-8'))
+        write_paragraphs(paras, sys.stdout.buffer)
 
 if __name__ == "__main__":
     main()
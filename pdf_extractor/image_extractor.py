@@ -5,10 +5,82 @@ import os
 import io
 import fitz
 import logging
-from typing import List, Set, Dict, Any, Optional
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
-from .utils import ensure_output_dir, sanitize_filename
+from .utils import ensure_output_dir, sanitize_filename, select_page_indices
+from .parallel import map_pages
+
+
+# Threads used to write the images of a page while the next ones are decoded
+IMAGE_WRITE_THREADS = 8
+
+
+def _write_image(image_path: str, image_bytes: bytes) -> str:
+    """
+    Write image bytes to a file
+
+    Args:
+        image_path: Path of the file to write
+        image_bytes: Encoded image data
+
+    Returns:
+        The path that was written
+    """
+    with open(image_path, "wb") as img_file:
+        img_file.write(image_bytes)
+    return image_path
+
+
+def _extract_page_images(doc: fitz.Document, page_idx: int,
+                         image_dir: str) -> Tuple[int, List[str]]:
+    """
+    Save the images of a single page to image_dir
+
+    Images are written by the worker itself so only the file paths, not
+    the image bytes, travel back to the parent process. The writes run on a
+    thread pool, which releases the GIL, so the next image is extracted
+    while the previous ones are still being written.
+
+    Args:
+        doc: Open PDF document
+        page_idx: 0-indexed page number
+        image_dir: Directory to save the images in
+
+    Returns:
+        Tuple of (page_idx, list of paths to the saved image files)
+    """
+    page = doc[page_idx]
+    page_number = page_idx + 1  # Convert back to 1-indexed
+    image_list = page.get_images(full=True)
+    
+    if not image_list:
+        return page_idx, []
+    
+    with ThreadPoolExecutor(max_workers=min(IMAGE_WRITE_THREADS, len(image_list))) as writer:
+        pending = []
+        
+        # Process each image
+        for img_idx, img_info in enumerate(image_list):
+            xref = img_info[0]  # Image reference number
+            base_image = doc.extract_image(xref)
+            
+            if base_image:
+                image_bytes = base_image["image"]
+                image_ext = base_image["ext"]
+                
+                # Save the image
+                image_filename = f"page{page_number}_image{img_idx+1}.{image_ext}"
+                image_path = os.path.join(image_dir, image_filename)
+                pending.append(writer.submit(_write_image, image_path, image_bytes))
+        
+        # Wait for the writes, raising the first error if any failed
+        saved_files = [future.result() for future in pending]
+    
+    return page_idx, saved_files
 
 
 class ImageExtractor:
@@ -16,25 +88,30 @@ class ImageExtractor:
     Extract images from PDF files using PyMuPDF
     """
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(self, logger: Optional[logging.Logger] = None,
+                 max_workers: Optional[int] = None):
         """
         Initialize the image extractor
         
         Args:
             logger: Logger object for logging messages
+            max_workers: Number of worker processes (default: CPU count)
         """
         self.logger = logger or logging.getLogger(__name__)
+        self.max_workers = max_workers
     
-    def extract_images(self, pdf_path: str, pages: Optional[Set[int]] = None,
-                      output_dir: str = "output") -> List[str]:
+    def extract_images(self, pdf_path: str, pages: Optional[Iterable[int]] = None,
+                      output_dir: str = "output",
+                      doc: Optional[fitz.Document] = None) -> List[str]:
         """
         Extract images from a PDF file
         
         Args:
             pdf_path: Path to the PDF file
-            pages: Set of page numbers to extract images from (1-indexed).
+            pages: Array, set or list of page numbers to extract images from (1-indexed).
                   If None, extract from all pages.
             output_dir: Directory to save output files
+            doc: Already opened PDF document. If None, pdf_path is opened.
             
         Returns:
             List of paths to the saved image files
@@ -50,59 +127,33 @@ class ImageExtractor:
         self.logger.info(f"Extracting images from {pdf_path}")
         
         try:
-            doc = fitz.open(pdf_path)
-            
-            # Determine which pages to process
-            if pages:
-                # Convert from 1-indexed to 0-indexed
-                page_indices = [p - 1 for p in pages if 0 < p <= len(doc)]
-                if len(page_indices) < len(pages):
-                    self.logger.warning(f"Some requested pages are out of range. PDF has {len(doc)} pages.")
-            else:
-                page_indices = range(len(doc))
-            
-            # Extract images from each page
-            for i in page_indices:
-                page = doc[i]
-                page_number = i + 1  # Convert back to 1-indexed
+            with (fitz.open(pdf_path) if doc is None else nullcontext(doc)) as doc:
+                # Determine which pages to process (0-indexed)
+                page_indices = select_page_indices(pages, len(doc), self.logger)
                 
-                # Get images from page
-                image_list = page.get_images(full=True)
-                
-                if not image_list:
-                    self.logger.info(f"No images found on page {page_number}")
-                    continue
-                
-                self.logger.info(f"Found {len(image_list)} images on page {page_number}")
-                
-                # Process each image
-                for img_idx, img_info in enumerate(image_list):
-                    xref = img_info[0]  # Image reference number
-                    base_image = doc.extract_image(xref)
+                # Extract images from the pages in parallel
+                page_func = partial(_extract_page_images, image_dir=image_dir)
+                for i, saved_files in map_pages(page_func, pdf_path, page_indices,
+                                                self.max_workers, doc=doc):
+                    page_number = i + 1  # Convert back to 1-indexed
+                    
+                    if not saved_files:
+                        self.logger.info(f"No images found on page {page_number}")
+                        continue
                     
-                    if base_image:
-                        image_bytes = base_image["image"]
-                        image_ext = base_image["ext"]
-                        
-                        # Save the image
-                        image_filename = f"page{page_number}_image{img_idx+1}.{image_ext}"
-                        image_path = os.path.join(image_dir, image_filename)
-                        
-                        with open(image_path, "wb") as img_file:
-                            img_file.write(image_bytes)
-                        
-                        output_files.append(image_path)
-                        image_count += 1
+                    self.logger.info(f"Found {len(saved_files)} images on page {page_number}")
+                    for image_path in saved_files:
                         self.logger.debug(f"Saved image to {image_path}")
-            
-            doc.close()
-            
-            if image_count > 0:
-                self.logger.info(f"Extracted {image_count} images to {image_dir}")
-            else:
-                self.logger.info("No images found in the PDF")
+                    
+                    output_files.extend(saved_files)
+                    image_count += len(saved_files)
                 
-            return output_files
+                if image_count > 0:
+                    self.logger.info(f"Extracted {image_count} images to {image_dir}")
+                else:
+                    self.logger.info("No images found in the PDF")
+                    
+                return output_files
                 
         except Exception as e:
             self.logger.error(f"Error extracting images: {e}")
@@ -6,6 +6,9 @@ import os
 import sys
 import argparse
 import logging
+import fitz
+import pdfplumber
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Optional, Set
 from rich.console import Console
@@ -103,68 +106,77 @@ def main() -> int:
     
     # Process the PDF file with the selected options
     try:
-        if args.text:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]Extracting text..."),
-                BarColumn(),
-                TimeElapsedColumn()
-            ) as progress:
-                task = progress.add_task("Extracting...", total=1)
-                extractor = TextExtractor(logger)
-                output_file = extractor.extract_text(args.file, pages, args.output)
-                progress.update(task, advance=1)
-            console.print(f"[green]✓[/] Text extracted to: [bold]{output_file}[/]")
-        
-        if args.tables:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]Extracting tables..."),
-                BarColumn(),
-                TimeElapsedColumn()
-            ) as progress:
-                task = progress.add_task("Extracting...", total=1)
-                extractor = TableExtractor(logger)
-                output_files = extractor.extract_tables(
-                    args.file, pages, args.output, args.table_format
-                )
-                progress.update(task, advance=1)
+        # Open the PDF once for all requested extractors instead of once each
+        with ExitStack() as stack:
+            doc = None
+            if args.text or args.images or args.ocr:
+                doc = stack.enter_context(fitz.open(args.file))
+            pdf = None
+            if args.tables:
+                pdf = stack.enter_context(pdfplumber.open(args.file))
             
-            if output_files:
-                console.print(f"[green]✓[/] {len(output_files)} tables extracted to: [bold]{args.output}[/]")
-            else:
-                console.print("[yellow]![/] No tables found in the document")
-        
-        if args.images:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]Extracting images..."),
-                BarColumn(),
-                TimeElapsedColumn()
-            ) as progress:
-                task = progress.add_task("Extracting...", total=1)
-                extractor = ImageExtractor(logger)
-                output_files = extractor.extract_images(args.file, pages, args.output)
-                progress.update(task, advance=1)
+            if args.text:
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[bold blue]Extracting text..."),
+                    BarColumn(),
+                    TimeElapsedColumn()
+                ) as progress:
+                    task = progress.add_task("Extracting...", total=1)
+                    extractor = TextExtractor(logger)
+                    output_file = extractor.extract_text(args.file, pages, args.output, doc=doc)
+                    progress.update(task, advance=1)
+                console.print(f"[green]✓[/] Text extracted to: [bold]{output_file}[/]")
+            
+            if args.tables:
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[bold blue]Extracting tables..."),
+                    BarColumn(),
+                    TimeElapsedColumn()
+                ) as progress:
+                    task = progress.add_task("Extracting...", total=1)
+                    extractor = TableExtractor(logger)
+                    output_files = extractor.extract_tables(
+                        args.file, pages, args.output, args.table_format, pdf=pdf
+                    )
+                    progress.update(task, advance=1)
                 
-            if output_files:
-                console.print(f"[green]✓[/] {len(output_files)} images extracted to: [bold]{args.output}[/]")
-            else:
-                console.print("[yellow]![/] No images found in the document")
-        
-        if args.ocr:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]Applying OCR..."),
-                BarColumn(),
-                TimeElapsedColumn()
-            ) as progress:
-                task = progress.add_task("Processing...", total=1)
-                extractor = OCRExtractor(logger)
-                output_file = extractor.extract_text_with_ocr(args.file, pages, args.output)
-                progress.update(task, advance=1)
-            console.print(f"[green]✓[/] OCR text extracted to: [bold]{output_file}[/]")
-        
+                if output_files:
+                    console.print(f"[green]✓[/] {len(output_files)} tables extracted to: [bold]{args.output}[/]")
+                else:
+                    console.print("[yellow]![/] No tables found in the document")
+            
+            if args.images:
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[bold blue]Extracting images..."),
+                    BarColumn(),
+                    TimeElapsedColumn()
+                ) as progress:
+                    task = progress.add_task("Extracting...", total=1)
+                    extractor = ImageExtractor(logger)
+                    output_files = extractor.extract_images(args.file, pages, args.output, doc=doc)
+                    progress.update(task, advance=1)
+                    
+                if output_files:
+                    console.print(f"[green]✓[/] {len(output_files)} images extracted to: [bold]{args.output}[/]")
+                else:
+                    console.print("[yellow]![/] No images found in the document")
+            
+            if args.ocr:
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[bold blue]Applying OCR..."),
+                    BarColumn(),
+                    TimeElapsedColumn()
+                ) as progress:
+                    task = progress.add_task("Processing...", total=1)
+                    extractor = OCRExtractor(logger)
+                    output_file = extractor.extract_text_with_ocr(args.file, pages, args.output, doc=doc)
+                    progress.update(task, advance=1)
+                console.print(f"[green]✓[/] OCR text extracted to: [bold]{output_file}[/]")
+            
         console.print("\n[bold green]✓ All tasks completed successfully![/]")
         return 0
         
@@ -5,12 +5,15 @@ import os
 import io
 import fitz
 import logging
+from contextlib import nullcontext
+import subprocess
+import tempfile
 import pytesseract
-from PIL import Image
-from typing import List, Set, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
-from .utils import ensure_output_dir, sanitize_filename
+from .utils import ensure_output_dir, sanitize_filename, select_page_indices
+from .parallel import map_pages
 
 # Set the tesseract command path if installed in default Windows location
 if os.name == 'nt':  # Windows
@@ -25,31 +28,101 @@ if os.name == 'nt':  # Windows
             pytesseract.pytesseract.tesseract_cmd = path
             break
 
+# Resolution to rasterize pages at; tesseract works best around 200-300 DPI
+OCR_DPI = 200
+
+# Most pages handed to a single tesseract run, which amortizes its
+# startup and model loading over the batch
+OCR_BATCH_SIZE = 8
+
+# Options for every tesseract run: English only, so no script detection,
+# the LSTM engine only (--oem 1), and each page read as a single uniform
+# block of text (--psm 6), which skips orientation detection and full page
+# layout analysis. Spaces between words are kept as they appear on the page.
+TESSERACT_OPTIONS = ["-l", "eng", "--oem", "1", "--psm", "6",
+                     "-c", "preserve_interword_spaces=1"]
+
+# Buffer size of the output file, large enough to batch many pages per write()
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _ocr_pages(doc: fitz.Document, page_indices: Tuple[int, ...]) -> List[Tuple[int, str]]:
+    """
+    Rasterize a batch of pages and apply OCR to all of them in one
+    tesseract run
+
+    Args:
+        doc: Open PDF document
+        page_indices: 0-indexed page numbers
+
+    Returns:
+        List of (page_idx, recognized text) tuples in the given order
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        image_paths = []
+        for page_idx in page_indices:
+            # Get the page as a grayscale pixmap (raster image), a third of
+            # the size of RGB and just as good for recognizing text
+            pix = doc[page_idx].get_pixmap(alpha=False, colorspace=fitz.csGRAY, dpi=OCR_DPI)
+            # Save as uncompressed PGM: writing it is a plain copy of the
+            # samples, where PNG would compress a page only to decompress it
+            image_path = os.path.join(tmp_dir, f"page{page_idx+1}.pgm")
+            pix.save(image_path)
+            image_paths.append(image_path)
+        
+        # tesseract treats a text file of image paths as a multi-page input
+        list_file = os.path.join(tmp_dir, "pages.txt")
+        with open(list_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(image_paths) + "\n")
+        
+        result = subprocess.run(
+            [pytesseract.pytesseract.tesseract_cmd, list_file, "stdout",
+             *TESSERACT_OPTIONS, "-c", "page_separator=\f"],
+            capture_output=True
+        )
+    
+    if result.returncode != 0:
+        raise pytesseract.TesseractError(result.returncode,
+                                         result.stderr.decode("utf-8", errors="ignore"))
+    
+    # Depending on the tesseract version the separator follows every page
+    # or only sits between pages, so keep one entry per page
+    page_texts = result.stdout.decode("utf-8").split("\f")[:len(page_indices)]
+    if len(page_texts) < len(page_indices):
+        raise pytesseract.TesseractError(result.returncode,
+                                         "tesseract returned fewer pages than requested")
+    return list(zip(page_indices, page_texts))
+
 
 class OCRExtractor:
     """
     Extract text from PDF images using OCR
     """
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(self, logger: Optional[logging.Logger] = None,
+                 max_workers: Optional[int] = None):
         """
         Initialize the OCR extractor
         
         Args:
             logger: Logger object for logging messages
+            max_workers: Number of worker processes (default: CPU count)
         """
         self.logger = logger or logging.getLogger(__name__)
+        self.max_workers = max_workers
     
-    def extract_text_with_ocr(self, pdf_path: str, pages: Optional[Set[int]] = None,
-                             output_dir: str = "output") -> str:
+    def extract_text_with_ocr(self, pdf_path: str, pages: Optional[Iterable[int]] = None,
+                             output_dir: str = "output",
+                             doc: Optional[fitz.Document] = None) -> str:
         """
         Apply OCR to images in a PDF and extract text
         
         Args:
             pdf_path: Path to the PDF file
-            pages: Set of page numbers to extract text from (1-indexed).
+            pages: Array, set or list of page numbers to extract text from (1-indexed).
                   If None, extract from all pages.
             output_dir: Directory to save output
+            doc: Already opened PDF document. If None, pdf_path is opened.
             
         Returns:
             Path to the output text file
@@ -68,47 +141,35 @@ class OCRExtractor:
         self.logger.info(f"Applying OCR to {pdf_path}")
         
         try:
-            doc = fitz.open(pdf_path)
-            
-            # Determine which pages to process
-            if pages:
-                # Convert from 1-indexed to 0-indexed
-                page_indices = [p - 1 for p in pages if 0 < p <= len(doc)]
-                if len(page_indices) < len(pages):
-                    self.logger.warning(f"Some requested pages are out of range. PDF has {len(doc)} pages.")
-            else:
-                page_indices = range(len(doc))
-            
-            ocr_text = []
-            
-            # Process each page
-            for i in page_indices:
-                page = doc[i]
-                page_number = i + 1  # Convert back to 1-indexed
-                
-                self.logger.info(f"Processing page {page_number} with OCR")
+            with (fitz.open(pdf_path) if doc is None else nullcontext(doc)) as doc:
+                # Determine which pages to process (0-indexed)
+                page_indices = select_page_indices(pages, len(doc), self.logger)
                 
-                # Get the page as a pixmap (raster image)
-                pix = page.get_pixmap(alpha=False)
+                self.logger.info(f"Processing {len(page_indices)} pages with OCR")
                 
-                # Convert pixmap to PIL Image
-                img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+                # Split the pages into batches, small enough that every worker
+                # process gets one when there are only a few pages
+                workers = self.max_workers or os.cpu_count() or 1
+                batch_size = max(1, min(OCR_BATCH_SIZE, -(-len(page_indices) // workers)))
+                batches = [tuple(page_indices[k:k + batch_size])
+                           for k in range(0, len(page_indices), batch_size)]
                 
-                # Apply OCR to the image
-                page_text = pytesseract.image_to_string(img)
+                # OCR is CPU-bound per page, so spread the batches over worker
+                # processes, and write each page as soon as its batch is done
+                with open(output_file, "w", encoding="utf-8",
+                          buffering=WRITE_BUFFER_SIZE) as f:
+                    for batch_results in map_pages(_ocr_pages, pdf_path, batches,
+                                                   self.max_workers, chunksize=1, doc=doc):
+                        for i, page_text in batch_results:
+                            page_number = i + 1  # Convert back to 1-indexed
+                            self.logger.debug(f"OCR complete for page {page_number}")
+                            
+                            f.write(f"--- Page {page_number} ---\n")
+                            f.write(page_text)
+                            f.write("\n\n")
                 
-                ocr_text.append(f"--- Page {page_number} ---\n")
-                ocr_text.append(page_text)
-                ocr_text.append("\n\n")
-            
-            doc.close()
-            
-            # Write the OCR text to a file
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write("".join(ocr_text))
-            
-            self.logger.info(f"OCR text extraction complete. Output saved to {output_file}")
-            return output_file
+                self.logger.info(f"OCR text extraction complete. Output saved to {output_file}")
+                return output_file
                 
         except Exception as e:
             self.logger.error(f"Error extracting OCR text: {e}")
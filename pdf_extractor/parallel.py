@@ -0,0 +1,78 @@
+"""
+Helpers for spreading per-page work across worker processes
+"""
+import os
+import fitz
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+# Document opened once per worker process by _init_worker
+_worker_doc: Optional[fitz.Document] = None
+
+
+def _init_worker(pdf_path: str) -> None:
+    """
+    Open the PDF once in a freshly started worker process
+
+    Also limits OpenMP to one thread, so that libraries such as tesseract
+    running in several workers at once do not oversubscribe the CPU.
+
+    Args:
+        pdf_path: Path to the PDF file
+    """
+    global _worker_doc
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    _worker_doc = fitz.open(pdf_path)
+
+
+def _run_page(func: Callable[[fitz.Document, Any], Any], item: Any) -> Any:
+    """
+    Apply a per-page function to the worker's document
+
+    Args:
+        func: Module-level function taking (doc, item)
+        item: Work item, typically a 0-indexed page number
+
+    Returns:
+        Whatever func returns
+    """
+    return func(_worker_doc, item)
+
+
+def map_pages(func: Callable[[fitz.Document, Any], Any], pdf_path: str,
+              items: Iterable[Any], max_workers: Optional[int] = None,
+              chunksize: int = 4, doc: Optional[fitz.Document] = None) -> Iterator[Any]:
+    """
+    Apply func to every work item, in parallel across worker processes
+
+    fitz.Document objects cannot be pickled, so each worker reopens the PDF
+    itself and func must be a module-level function. Results are yielded in
+    the same order as items. With a single worker or a single item the work
+    runs in the current process instead of paying for a pool, using doc
+    when the caller already has the PDF open.
+
+    Args:
+        func: Module-level function taking (doc, item)
+        pdf_path: Path to the PDF file
+        items: Work items, typically 0-indexed page numbers or batches of them
+        max_workers: Number of worker processes (default: CPU count)
+        chunksize: Number of items sent to a worker at a time
+        doc: Already opened PDF document, if any
+
+    Returns:
+        Iterator over the results of func, in input order
+    """
+    items = list(items)
+    workers = min(max_workers or os.cpu_count() or 1, len(items))
+
+    if workers <= 1:
+        with (fitz.open(pdf_path) if doc is None else nullcontext(doc)) as doc:
+            for item in items:
+                yield func(doc, item)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(pdf_path,)) as executor:
+        yield from executor.map(_run_page, repeat(func), items, chunksize=chunksize)
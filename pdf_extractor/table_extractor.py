@@ -2,14 +2,52 @@
 Module for extracting tables from PDF files using pdfplumber
 """
 import os
+import csv
 import json
 import logging
 import pdfplumber
-import pandas as pd
-from typing import List, Set, Dict, Any, Optional
+from contextlib import nullcontext
+from typing import Iterable, List, Dict, Any, Optional
 from pathlib import Path
 
-from .utils import ensure_output_dir, sanitize_filename
+from .utils import ensure_output_dir, sanitize_filename, select_page_indices
+
+# Settings for page.extract_tables, spelled out so detection does not change
+# with pdfplumber's defaults: only ruling lines delimit cells, which skips the
+# much slower clustering of characters used by the "text" strategies
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+}
+
+
+def _record_keys(header: List[Optional[str]]) -> List[str]:
+    """
+    Build unique JSON record keys from a table's header row
+    
+    pdfplumber returns None for blank or merged header cells, and header
+    cells may repeat. Such cells are named col<N> after their 1-indexed
+    column, so no column is dropped when rows are turned into dicts.
+    
+    Args:
+        header: First row of the table
+        
+    Returns:
+        One unique key per column
+    """
+    keys = []
+    seen = set()
+    for idx, cell in enumerate(header):
+        key = cell
+        if key is None or key in seen:
+            key = f"col{idx+1}"
+            suffix = 1
+            while key in seen or key in header:
+                suffix += 1
+                key = f"col{idx+1}_{suffix}"
+        keys.append(key)
+        seen.add(key)
+    return keys
 
 
 class TableExtractor:
@@ -26,18 +64,20 @@ class TableExtractor:
         """
         self.logger = logger or logging.getLogger(__name__)
     
-    def extract_tables(self, pdf_path: str, pages: Optional[Set[int]] = None,
+    def extract_tables(self, pdf_path: str, pages: Optional[Iterable[int]] = None,
                       output_dir: str = "output", 
-                      output_format: str = "csv") -> List[str]:
+                      output_format: str = "csv",
+                      pdf: Optional[pdfplumber.PDF] = None) -> List[str]:
         """
         Extract tables from a PDF file
         
         Args:
             pdf_path: Path to the PDF file
-            pages: Set of page numbers to extract tables from (1-indexed).
+            pages: Array, set or list of page numbers to extract tables from (1-indexed).
                   If None, extract from all pages.
             output_dir: Directory to save output files
             output_format: Format to save tables (csv or json)
+            pdf: Already opened pdfplumber PDF. If None, pdf_path is opened.
             
         Returns:
             List of paths to the output files
@@ -52,21 +92,15 @@ class TableExtractor:
         self.logger.info(f"Extracting tables from {pdf_path}")
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                # Determine which pages to process
-                if pages:
-                    # pdfplumber is 0-indexed, but our interface is 1-indexed
-                    page_indices = [p - 1 for p in pages if 0 < p <= len(pdf.pages)]
-                    if len(page_indices) < len(pages):
-                        self.logger.warning(f"Some requested pages are out of range. PDF has {len(pdf.pages)} pages.")
-                    pdf_pages = [pdf.pages[i] for i in page_indices]
-                else:
-                    pdf_pages = pdf.pages
+            with (pdfplumber.open(pdf_path) if pdf is None else nullcontext(pdf)) as pdf:
+                # Determine which pages to process (pdfplumber is 0-indexed too)
+                page_indices = select_page_indices(pages, len(pdf.pages), self.logger)
+                pdf_pages = [pdf.pages[i] for i in page_indices]
 
                 # Process each page
                 for i, page in enumerate(pdf_pages):
                     page_number = page.page_number + 1  # Convert back to 1-indexed
-                    tables = page.extract_tables()
+                    tables = page.extract_tables(table_settings=TABLE_SETTINGS)
                     
                     if not tables:
                         self.logger.info(f"No tables found on page {page_number}")
@@ -76,23 +110,31 @@ class TableExtractor:
                     
                     # Process each table
                     for table_idx, table_data in enumerate(tables):
-                        # Convert table data to DataFrame
-                        # First row is header if it has different formatting
+                        # First row is the header, the rest are records
                         if not table_data:
                             continue
                             
-                        df = pd.DataFrame(table_data[1:], columns=table_data[0])
-                        
                         # Generate output filename
                         output_basename = f"{sanitize_filename(pdf_filename)}_page{page_number}_table{table_idx+1}"
                         
                         # Save table based on requested format
                         if output_format == "csv":
                             output_file = os.path.join(output_dir, f"{output_basename}.csv")
-                            df.to_csv(output_file, index=False)
+                            with open(output_file, "w", newline="", encoding="utf-8") as f:
+                                # "\n" line endings, as pandas wrote them
+                                csv.writer(f, lineterminator="\n").writerows(table_data)
                         else:  # json
                             output_file = os.path.join(output_dir, f"{output_basename}.json")
-                            df.to_json(output_file, orient="records", indent=2)
+                            header = table_data[0]
+                            keys = _record_keys(header)
+                            if keys != header:
+                                self.logger.warning(
+                                    f"Table {table_idx+1} on page {page_number} has blank or "
+                                    f"duplicate header cells, saved as keys {keys}"
+                                )
+                            with open(output_file, "w", encoding="utf-8") as f:
+                                json.dump([dict(zip(keys, row)) for row in table_data[1:]],
+                                          f, indent=2)
                             
                         output_files.append(output_file)
                         self.logger.info(f"Table saved to {output_file}")
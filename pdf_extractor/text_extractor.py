@@ -4,10 +4,39 @@ Module for extracting text from PDF files using PyMuPDF (fitz)
 import os
 import fitz
 import logging
-from typing import List, Set, Optional
+from contextlib import nullcontext
+from typing import Iterable, List, Optional, Tuple
 from pathlib import Path
 
-from .utils import ensure_output_dir, sanitize_filename
+from .utils import ensure_output_dir, sanitize_filename, select_page_indices
+from .parallel import map_pages
+
+# Flags for page.get_text: PyMuPDF's own default for "text" extraction, so the
+# output matches a plain get_text() call. Recent versions include
+# TEXT_CID_FOR_UNKNOWN_UNICODE there, which keeps glyphs of fonts without a
+# ToUnicode map readable; older versions without TEXTFLAGS_TEXT get the
+# equivalent of their default.
+TEXT_FLAGS = getattr(
+    fitz, "TEXTFLAGS_TEXT",
+    fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+)
+
+# Buffer size of the output file, large enough to batch many pages per write()
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _extract_page_text(doc: fitz.Document, page_idx: int) -> Tuple[int, bytes]:
+    """
+    Extract the text of a single page
+
+    Args:
+        doc: Open PDF document
+        page_idx: 0-indexed page number
+
+    Returns:
+        Tuple of (page_idx, UTF-8 encoded page text)
+    """
+    return page_idx, doc[page_idx].get_text("text", flags=TEXT_FLAGS).encode("utf-8")
 
 
 class TextExtractor:
@@ -15,25 +44,30 @@ class TextExtractor:
     Extract text from PDF files using PyMuPDF (fitz)
     """
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(self, logger: Optional[logging.Logger] = None,
+                 max_workers: Optional[int] = None):
         """
         Initialize the text extractor
         
         Args:
             logger: Logger object for logging messages
+            max_workers: Number of worker processes (default: CPU count)
         """
         self.logger = logger or logging.getLogger(__name__)
+        self.max_workers = max_workers
     
-    def extract_text(self, pdf_path: str, pages: Optional[Set[int]] = None, 
-                    output_dir: str = "output") -> str:
+    def extract_text(self, pdf_path: str, pages: Optional[Iterable[int]] = None, 
+                    output_dir: str = "output",
+                    doc: Optional[fitz.Document] = None) -> str:
         """
         Extract text from a PDF file
         
         Args:
             pdf_path: Path to the PDF file
-            pages: Set of page numbers to extract text from (1-indexed).
+            pages: Array, set or list of page numbers to extract text from (1-indexed).
                   If None, extract all pages.
             output_dir: Directory to save output
+            doc: Already opened PDF document. If None, pdf_path is opened.
             
         Returns:
             Path to the output file
@@ -45,28 +79,19 @@ class TextExtractor:
         self.logger.info(f"Extracting text from {pdf_path}")
         
         try:
-            with fitz.open(pdf_path) as doc:
-                text_content = []
-                
-                # Determine which pages to process
-                if pages:
-                    # Convert from 1-indexed to 0-indexed
-                    page_indices = [p - 1 for p in pages if 0 < p <= len(doc)]
-                    if len(page_indices) < len(pages):
-                        self.logger.warning(f"Some requested pages are out of range. PDF has {len(doc)} pages.")
-                else:
-                    page_indices = range(len(doc))
-                
-                # Process each page
-                for i in page_indices:
-                    page = doc[i]
-                    text_content.append(f"--- Page {i+1} ---\n")
-                    text_content.append(page.get_text())
-                    text_content.append("\n\n")
+            with (fitz.open(pdf_path) if doc is None else nullcontext(doc)) as doc:
+                # Determine which pages to process (0-indexed)
+                page_indices = select_page_indices(pages, len(doc), self.logger)
                 
-                # Write the extracted text to a file
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write("".join(text_content))
+                # Process the pages in parallel, results come back in page order.
+                # Workers encode the text too, so each page is written to the
+                # file as it arrives instead of keeping the whole document.
+                with open(output_file, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                    for i, page_text in map_pages(_extract_page_text, pdf_path,
+                                                  page_indices, self.max_workers, doc=doc):
+                        f.write(b"--- Page %d ---\n" % (i + 1))
+                        f.write(page_text)
+                        f.write(b"\n\n")
                 
                 self.logger.info(f"Text extraction complete. Output saved to {output_file}")
                 return output_file
@@ -4,7 +4,11 @@ Utility functions for the PDF Extractor CLI
 import os
 import logging
 import re
-from typing import List, Tuple, Set
+import numpy as np
+from typing import Iterable, List, Tuple, Optional
+
+# Characters that are not safe in a filename
+_SANITIZE_RE = re.compile(r'[^\w\-\.]')
 
 
 def setup_logging(log_level: int = logging.INFO) -> logging.Logger:
@@ -40,30 +44,59 @@ def ensure_output_dir(dirname: str = "output") -> str:
     return dirname
 
 
-def parse_page_ranges(pages_str: str) -> Set[int]:
+def parse_page_ranges(pages_str: str) -> np.ndarray:
     """
-    Parse a string like "1-3,5,7-9" into a set of page numbers
+    Parse a string like "1-3,5,7-9" into a sorted array of page numbers
     
     Args:
         pages_str: String representation of page ranges
         
     Returns:
-        Set of page numbers
+        Sorted array of unique page numbers
         
     Example:
-        "1-3,5,7-9" returns {1, 2, 3, 5, 7, 8, 9}
+        "1-3,5,7-9" returns array([1, 2, 3, 5, 7, 8, 9])
     """
     if not pages_str:
-        return set()
+        return np.empty(0, dtype=np.int64)
         
-    pages = set()
+    ranges = []
     for part in pages_str.split(','):
         if '-' in part:
             start, end = map(int, part.split('-'))
-            pages.update(range(start, end + 1))
+            ranges.append(np.arange(start, end + 1, dtype=np.int64))
         else:
-            pages.add(int(part))
-    return pages
+            ranges.append(np.array([int(part)], dtype=np.int64))
+    return np.unique(np.concatenate(ranges))
+
+
+def select_page_indices(pages: Optional[Iterable[int]], page_count: int,
+                        logger: logging.Logger) -> List[int]:
+    """
+    Turn requested page numbers into 0-indexed indices of existing pages
+    
+    Args:
+        pages: Page numbers (1-indexed), as returned by parse_page_ranges
+              or any set or list of ints. If None or empty, select all pages.
+        page_count: Number of pages in the PDF
+        logger: Logger used to warn about out of range pages
+        
+    Returns:
+        Sorted list of 0-indexed page numbers
+    """
+    if pages is None:
+        return list(range(page_count))
+        
+    # Accept the sets and lists callers passed before parse_page_ranges
+    # returned arrays, and drop any duplicates
+    pages = np.unique(np.asarray(list(pages), dtype=np.int64))
+    if not len(pages):
+        return list(range(page_count))
+        
+    in_range = (pages >= 1) & (pages <= page_count)
+    if not in_range.all():
+        logger.warning(f"Some requested pages are out of range. PDF has {page_count} pages.")
+    return (pages[in_range] - 1).tolist()
 
 
 def sanitize_filename(filename: str) -> str:
@@ -77,5 +110,5 @@ def sanitize_filename(filename: str) -> str:
         A sanitized filename string
     """
     # Replace any non-alphanumeric character with underscore
-    sanitized = re.sub(r'[^\w\-\.]', '_', filename)
+    sanitized = _SANITIZE_RE.sub('_', filename)
     return sanitized 
\ No newline at end of file